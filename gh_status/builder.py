@@ -1,12 +1,22 @@
 # gh_status/builder.py
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import itertools
+import json
 import logging
 import re
+import shutil
+import time
+import tomllib
 from collections import Counter
-from datetime import datetime, timedelta, timezone
-from typing import Any, List
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, List, Optional
 
+import msgspec
 import pytz
 
 from . import github_client, schemas
@@ -16,25 +26,110 @@ logger = logging.getLogger(__name__)
 # Define how many of the top repos are considered "hot" to fetch detailed content for.
 HOT_REPO_COUNT = 3
 
+# Upper bound on concurrent GraphQL requests while building the TODO feed.
+MAX_CONCURRENT_FETCHES = 10
 
-# --- Helper Functions ---
+# How many repos to fold into a single GraphQL request, to stay within node limits.
+GRAPHQL_BATCH_SIZE = 50
+
+# Parsed markdown is cached on disk, keyed by a hash of the raw content, so files
+# that have not changed since the last run skip parsing entirely.
+# Bump the version when the parsing rules change; it names the cache directory,
+# so directories left by older versions can be removed wholesale.
+MARKDOWN_CACHE_VERSION = "3"
+MARKDOWN_CACHE_DIR = (
+    Path.home() / ".cache" / "gh_status" / f"md-v{MARKDOWN_CACHE_VERSION}"
+)
+# Cache entries that have not been read or written for this long are pruned.
+MARKDOWN_CACHE_MAX_AGE_DAYS = 30
+
+# Markdown list prefixes like *, -, [ ], [x] at the start of any line. Whitespace
+# excludes newlines, so one pass over a whole file never joins lines.
+_TODO_PREFIX_RE = re.compile(r"^[^\S\n]*[-*][^\S\n]*(\[[ xX]\])?[^\S\n]*", re.MULTILINE)
 
 
-def _normalize_todo_line(line: str) -> str:
-    """Strips markdown list markers, extra whitespace, and truncates the line."""
-    # Remove markdown list prefixes like *, -, [ ], [x]
-    line = re.sub(r"^\s*[-*]\s*(\[[ xX]\])?\s*", "", line)
-    return line.strip()
+# --- Helper Functions ---
 
 
 def _parse_todos_from_content(content: str) -> List[str]:
     """Extracts and normalizes TODO lines from a markdown file's content."""
-    todos = []
-    for line in content.splitlines():
-        normalized = _normalize_todo_line(line)
-        if normalized:
-            todos.append(normalized)
-    return todos
+    # Strip every list marker in a single regex pass instead of line by line.
+    # Rejoin on "\n" first so "^" sees the same line breaks splitlines() does.
+    normalized = _TODO_PREFIX_RE.sub("", "\n".join(content.splitlines()))
+    return [todo for line in normalized.splitlines() if (todo := line.strip())]
+
+
+def _extract_synopsis(content: str, max_lines: int = 5) -> List[str]:
+    """Returns the first few non-header lines of a README as its synopsis."""
+    # Strip each line once and stop as soon as enough lines have been found.
+    stripped = (line.strip() for line in content.splitlines())
+    return list(
+        itertools.islice(
+            (line for line in stripped if line and not line.startswith("#")),
+            max_lines,
+        )
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_markdown(content: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Returns the (todos, synopsis) parsed from a markdown file's content.
+    Results are memoized in-process and persisted to MARKDOWN_CACHE_DIR.
+    """
+    key = hashlib.sha1(
+        f"{MARKDOWN_CACHE_VERSION}:{content}".encode(), usedforsecurity=False
+    ).hexdigest()
+    cache_path = MARKDOWN_CACHE_DIR / f"{key}.json"
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        result = tuple(cached["todos"]), tuple(cached["synopsis"])
+        # Refresh the mtime so entries still in use survive pruning.
+        cache_path.touch()
+        return result
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    todos = tuple(_parse_todos_from_content(content))
+    synopsis = tuple(_extract_synopsis(content))
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(
+            json.dumps({"todos": todos, "synopsis": synopsis}), encoding="utf-8"
+        )
+    except OSError as e:
+        logger.debug("Could not write markdown cache %s: %s", cache_path, e)
+    return todos, synopsis
+
+
+def prune_markdown_cache(max_age_days: int = MARKDOWN_CACHE_MAX_AGE_DAYS) -> None:
+    """
+    Removes markdown cache directories left by older cache versions, and entries
+    in the current one that have not been used for max_age_days.
+    """
+    cutoff = time.time() - max_age_days * 24 * 60 * 60
+    try:
+        for path in MARKDOWN_CACHE_DIR.parent.glob("md*"):
+            if path.is_dir() and path != MARKDOWN_CACHE_DIR:
+                shutil.rmtree(path, ignore_errors=True)
+        for entry in MARKDOWN_CACHE_DIR.glob("*.json"):
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug("Could not prune markdown cache %s: %s", MARKDOWN_CACHE_DIR, e)
+
+
+def _calculate_streak(active_days: set[date]) -> int:
+    """Counts the consecutive active days ending on the most recent active day."""
+    if not active_days:
+        return 0
+    one_day = timedelta(days=1)
+    current_day = max(active_days)
+    streak = 1
+    while current_day - one_day in active_days:
+        current_day -= one_day
+        streak += 1
+    return streak
 
 
 def _is_meaningful_event(event: dict[str, Any]) -> bool:
@@ -54,77 +149,124 @@ def _is_meaningful_event(event: dict[str, Any]) -> bool:
 # --- Builder Functions ---
 
 
-def build_inventory(
-    client: github_client.GitHubClient, username: str
+def load_prior_inventory(path: Path) -> Optional[schemas.Inventory]:
+    """
+    Loads the inventory written by a previous run, or None if there is no usable one.
+    """
+    try:
+        with path.open("rb") as f:
+            return msgspec.convert(tomllib.load(f), schemas.Inventory)
+    except FileNotFoundError:
+        return None
+    except (OSError, tomllib.TOMLDecodeError, msgspec.ValidationError) as e:
+        logger.warning("Ignoring unreadable prior inventory %s: %s", path, e)
+        return None
+
+
+async def build_inventory(
+    client: github_client.GitHubClient,
+    username: str,
+    prior: Optional[schemas.Inventory] = None,
 ) -> schemas.Inventory:
     """
     Builds the repository inventory, including detailed content for "hot" repos.
+    Details are reused from `prior` for hot repos that have not been pushed since.
     """
-    repos = client.get_public_repos()
+    repos = await client.get_public_repos()
+    prior_repos = {repo.full: repo for repo in prior.repo} if prior else {}
 
     # Identify the top N most recently pushed repos as "hot"
-    hot_repo_names = {repo.full for repo in repos[:HOT_REPO_COUNT]}
-    logger.info("Identified hot repos for detailed summary: %s", hot_repo_names)
-
-    for repo in repos:
-        if repo.full in hot_repo_names:
-            logger.info("Fetching details for hot repo: %s", repo.full)
-            # Fetch detailed content using the repo's specific default_branch
-            repo.readme = client.get_file_content(
-                repo.full, "README.md", branch=repo.default_branch
-            )
-            repo.changelog = client.get_file_content(
+    hot_repos = repos[:HOT_REPO_COUNT]
+    logger.info(
+        "Identified hot repos for detailed summary: %s",
+        {repo.full for repo in hot_repos},
+    )
+
+    async def fetch_details(repo: schemas.RepoInventoryItem) -> None:
+        prior_repo = prior_repos.get(repo.full)
+        if (
+            prior_repo
+            and repo.pushed_utc <= prior_repo.pushed_utc
+            and (prior_repo.readme or prior_repo.changelog or prior_repo.recent_files)
+        ):
+            logger.info("Reusing details for unchanged hot repo: %s", repo.full)
+            repo.readme = prior_repo.readme
+            repo.changelog = prior_repo.changelog
+            repo.recent_files = prior_repo.recent_files
+            return
+
+        logger.info("Fetching details for hot repo: %s", repo.full)
+        # Fetch detailed content using the repo's specific default_branch
+        repo.readme, repo.changelog, repo.recent_files = await asyncio.gather(
+            client.get_file_content(repo.full, "README.md", branch=repo.default_branch),
+            client.get_file_content(
                 repo.full, "CHANGELOG.md", branch=repo.default_branch
-            )
-            repo.recent_files = client.get_recent_file_changes(repo.full)
+            ),
+            client.get_recent_file_changes(repo.full, repo.default_branch),
+        )
+
+    await asyncio.gather(*(fetch_details(repo) for repo in hot_repos))
 
     return schemas.Inventory(
         username=username, generated_utc=datetime.utcnow(), repo=repos
     )
 
 
-def build_todos(
+async def build_todos(
     client: github_client.GitHubClient, inventory: schemas.Inventory
 ) -> schemas.Todos:
     """
     Builds the aggregated TODO list by fetching content from each repository.
     """
-    repo_todos_list = []
-
     todo_filenames = [
         "docs/TODO.md",
         # "TODO.md", "todo.md",
         # "docs/ROADMAP.md"
     ]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+    # Look for TODO files (and the README, unless the inventory already has it)
+    # on each repo's default branch.
+    wanted = [
+        (
+            repo.full,
+            repo.default_branch,
+            todo_filenames if repo.readme else [*todo_filenames, "README.md"],
+        )
+        for repo in inventory.repo
+    ]
 
+    async def fetch_batch(
+        batch: list[tuple[str, str, list[str]]],
+    ) -> dict[str, dict[str, Optional[str]]]:
+        async with semaphore:
+            return await client.get_files_content(batch)
+
+    batches = await asyncio.gather(
+        *(
+            fetch_batch(wanted[i : i + GRAPHQL_BATCH_SIZE])
+            for i in range(0, len(wanted), GRAPHQL_BATCH_SIZE)
+        )
+    )
+    contents = {full: files for batch in batches for full, files in batch.items()}
+
+    repo_todos_list = []
     for repo in inventory.repo:
         repo_todos = schemas.RepoTodosItem(full=repo.full)
+        files = contents.get(repo.full, {})
 
-        # 1. Look for a TODO file on the correct branch
-        todo_content = None
+        # 1. The first candidate TODO file that exists wins.
         for filename in todo_filenames:
-            content = client.get_file_content(
-                repo.full, filename, branch=repo.default_branch
-            )
+            content = files.get(filename)
             if content:
                 logger.info("Found TODOs for %s in %s", repo.full, filename)
-                todo_content = content
+                repo_todos.todos = list(_parse_markdown(content)[0])
                 break
 
-        if todo_content:
-            repo_todos.todos = _parse_todos_from_content(todo_content)
-
         # 2. Get synopsis from README on the correct branch
-        readme_content = repo.readme or client.get_file_content(
-            repo.full, "README.md", branch=repo.default_branch
-        )
+        readme_content = repo.readme or files.get("README.md")
         if readme_content:
-            synopsis_lines = [
-                line.strip()
-                for line in readme_content.strip().splitlines()
-                if line.strip() and not line.strip().startswith("#")
-            ][:5]
-            repo_todos.synopsis = synopsis_lines
+            repo_todos.synopsis = list(_parse_markdown(readme_content)[1])
 
         repo_todos_list.append(repo_todos)
 
@@ -136,57 +278,43 @@ def build_todos(
 
 
 def build_activity(
-    client: github_client.GitHubClient, username: str, tz_name: str, window_days: int
+    all_events: List[dict[str, Any]], username: str, tz_name: str, window_days: int
 ) -> schemas.Activity:
-    """Builds the activity feed for a given time window (e.g., 7 or 30 days)."""
+    """
+    Builds the activity feed for a given time window (e.g., 7 or 30 days).
+    The same fetched events can be shared by every window.
+    """
     # CORRECT WAY to get an offset-aware UTC timestamp
     now_utc = datetime.now(timezone.utc)
     window_start_utc = now_utc - timedelta(days=window_days)
     local_tz = pytz.timezone(tz_name)
 
-    all_events = client.get_public_events()
-
-    # Filter events within the window (this comparison will now work correctly)
-    window_events = [
-        e
-        for e in all_events
-        if datetime.fromisoformat(e["created_at"].replace("Z", "+00:00"))
-        >= window_start_utc
-        and _is_meaningful_event(e)
-    ]
+    # Filter events within the window and tally them in a single pass, parsing
+    # each timestamp only once.
+    window_events = []
+    repo_counter: Counter[str] = Counter()
+    type_counter: Counter[str] = Counter()
+    events_by_local_day: Counter[date] = Counter()
+    for event in all_events:
+        event_time_utc = datetime.fromisoformat(event["created_at"])
+        if event_time_utc < window_start_utc or not _is_meaningful_event(event):
+            continue
+        window_events.append((event, event_time_utc))
+        repo_counter[event["repo"]["name"]] += 1
+        type_counter[event["type"]] += 1
+        events_by_local_day[event_time_utc.astimezone(local_tz).date()] += 1
 
     # --- Calculate Summary and Insights ---
-    repo_counter = Counter(e["repo"]["name"] for e in window_events)
-    type_counter = Counter(e["type"] for e in window_events)
-
-    # Busiest day and streak
-    events_by_local_day: Counter[str] = Counter()
-    for event in window_events:
-        event_time_utc = datetime.fromisoformat(
-            event["created_at"].replace("Z", "+00:00")
-        )
-        local_day = event_time_utc.astimezone(local_tz).strftime("%Y-%m-%d")
-        events_by_local_day[local_day] += 1
-
     busiest_day = (
-        events_by_local_day.most_common(1)[0][0] if events_by_local_day else None
+        events_by_local_day.most_common(1)[0][0].isoformat()
+        if events_by_local_day
+        else None
     )
 
     # Calculate streak
-    active_days = sorted(events_by_local_day.keys())
-    streak = 0
-    if active_days:
-        streak = 1
-        current_day = datetime.strptime(active_days[-1], "%Y-%m-%d").date()
-        for i in range(len(active_days) - 2, -1, -1):
-            prev_day = datetime.strptime(active_days[i], "%Y-%m-%d").date()
-            if current_day - prev_day == timedelta(days=1):
-                streak += 1
-                current_day = prev_day
-            else:
-                break
+    streak = _calculate_streak(set(events_by_local_day))
 
-    # --- Assemble Pydantic Models ---
+    # --- Assemble Schema Structs ---
     summary = schemas.ActivitySummary(
         events=len(window_events),
         repos=len(repo_counter),
@@ -211,7 +339,7 @@ def build_activity(
     )
 
     events_list = []
-    for event in window_events:
+    for event, event_time_utc in window_events:
         repo_name_full = event["repo"]["name"]
         repo_owner, repo_name_short = repo_name_full.split("/")
 
@@ -223,9 +351,10 @@ def build_activity(
             commit_count = event["payload"].get("size", 0)
             plural = "s" if commit_count != 1 else ""
             title = f"Pushed {commit_count} commit{plural} to {repo_name_full}"
+            # partition() takes the first line without splitting the whole message.
             commits = [
-                f"{c['sha'][:7]}: {c['message'].splitlines()[0]}"
-                for c in event["payload"].get("commits", [])
+                f"{c['sha'][:7]}: {c['message'].partition('\n')[0]}"
+                for c in event["payload"].get("commits", ())
             ]
             if "ref" in event["payload"]:
                 url = f"https://github.com/{repo_name_full}/tree/{event['payload']['ref']}"
@@ -240,7 +369,7 @@ def build_activity(
                 type=event["type"],
                 repo_owner=repo_owner,
                 repo_name=repo_name_short,
-                at_utc=event["created_at"],
+                at_utc=event_time_utc,
                 url=url,
                 title=title,
                 commits=commits,
@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import logging
 import os
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import dotenv
+import msgspec
 import pytz
 
 from gh_status import builder, github_client, writers
@@ -45,6 +47,61 @@ def _build_info(username: str) -> dict[str, object]:
     }
 
 
+def _write_feed(toml_path: Path, data: msgspec.Struct) -> None:
+    """Writes one feed as TOML, JSON, and an HTML wrapper around the TOML."""
+    writers.write_toml(toml_path, data)
+    writers.write_json(toml_path.with_suffix(".json"), data)
+    writers.write_html_wrapper(toml_path)
+
+
+async def _generate_feeds(
+    username: str, token: str, tz_name: str, output_dir: Path
+) -> None:
+    """Fetches all data from GitHub and writes every feed to the output directory."""
+    async with github_client.GitHubClient(username=username, token=token) as client:
+        # 1. Build Inventory
+        logger.info("Building repository inventory...")
+        inventory_path = output_dir / "inventory.toml"
+        prior_inventory = builder.load_prior_inventory(inventory_path)
+        inventory = await builder.build_inventory(
+            client, username, prior=prior_inventory
+        )
+
+        # 2. Build TODOs and fetch public events concurrently; they only share
+        # the client and the inventory, which is already complete.
+        logger.info("Building aggregated TODOs and fetching public events...")
+        # Only events inside the longest (30-day) window are needed.
+        since_utc = datetime.now(timezone.utc) - timedelta(days=30)
+        todos, events = await asyncio.gather(
+            builder.build_todos(client, inventory),
+            client.get_public_events(since_utc=since_utc),
+        )
+
+        # The events are fetched once and filtered for each window.
+        logger.info("Building 7/30-day activity feeds...")
+        activity_7d = builder.build_activity(events, username, tz_name, window_days=7)
+        activity_30d = builder.build_activity(events, username, tz_name, window_days=30)
+
+    # 3. Write every feed; they are independent, so the file I/O and template
+    # rendering run in worker threads side by side, along with cache pruning.
+    await asyncio.gather(
+        asyncio.to_thread(_write_feed, inventory_path, inventory),
+        asyncio.to_thread(_write_feed, output_dir / "todos.toml", todos),
+        asyncio.to_thread(_write_feed, output_dir / "latest-7d.toml", activity_7d),
+        asyncio.to_thread(_write_feed, output_dir / "latest-30d.toml", activity_30d),
+        asyncio.to_thread(builder.prune_markdown_cache),
+    )
+
+    writers.write_dashboard(
+        output_dir,
+        inventory=inventory,
+        todos=todos,
+        activity_7d=activity_7d,
+        activity_30d=activity_30d,
+        build_info=_build_info(username),
+    )
+
+
 def main() -> int:
     """Main entrypoint for the gh-status CLI."""
     parser = argparse.ArgumentParser(
@@ -108,46 +165,7 @@ def main() -> int:
     output_dir.mkdir(exist_ok=True)
 
     try:
-        with github_client.GitHubClient(username=username, token=token) as client:
-            # 1. Build and write Inventory
-            logger.info("Building repository inventory...")
-            inventory = builder.build_inventory(client, username)
-            inventory_path = output_dir / "inventory.toml"
-            writers.write_toml(inventory_path, inventory)
-            writers.write_json(output_dir / "inventory.json", inventory)
-            writers.write_html_wrapper(inventory_path)
-
-            # 2. Build and write TODOs
-            logger.info("Building aggregated TODOs...")
-            todos = builder.build_todos(client, inventory)
-            todos_path = output_dir / "todos.toml"
-            writers.write_toml(todos_path, todos)
-            writers.write_json(output_dir / "todos.json", todos)
-            writers.write_html_wrapper(todos_path)
-
-            # 3. Build and write Activity Feeds
-            for days in [7, 30]:
-                logger.info("Building %d-day activity feed...", days)
-                activity = builder.build_activity(
-                    client, username, tz_name, window_days=days
-                )
-                activity_path = output_dir / f"latest-{days}d.toml"
-                writers.write_toml(activity_path, activity)
-                writers.write_json(output_dir / f"latest-{days}d.json", activity)
-                writers.write_html_wrapper(activity_path)
-                if days == 7:
-                    activity_7d = activity
-                else:
-                    activity_30d = activity
-
-            writers.write_dashboard(
-                output_dir,
-                inventory=inventory,
-                todos=todos,
-                activity_7d=activity_7d,
-                activity_30d=activity_30d,
-                build_info=_build_info(username),
-            )
+        asyncio.run(_generate_feeds(username, token, tz_name, output_dir))
         logger.info("✅ Successfully generated all feeds in '%s'.", output_dir)
         return 0
     except Exception:
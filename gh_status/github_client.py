@@ -1,17 +1,31 @@
 # gh_status/github_client.py
 from __future__ import annotations
 
+import json
 import logging
-from typing import Any, List, Optional
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence
 
+import hishel
 import httpx
-from hishel.httpx import SyncCacheClient as CacheClient
+import orjson
+from hishel.httpx import AsyncCacheClient as CacheClient
 
 from . import schemas
 
 logger = logging.getLogger(__name__)
 
 API_URL = "https://api.github.com"
+GRAPHQL_URL = f"{API_URL}/graphql"
+
+# The HTTP cache persists across runs, so stored ETags can be revalidated.
+HTTP_CACHE_PATH = Path.home() / ".cache" / "gh_status" / "http_cache.db"
+
+
+def _json(response: httpx.Response) -> Any:
+    """Decodes a JSON response body with orjson (much faster than stdlib json)."""
+    return orjson.loads(response.content)
 
 
 class GitHubClient:
@@ -33,36 +47,66 @@ class GitHubClient:
         }
         # hishel wraps httpx to provide RFC 9111 compliant caching.
         # It automatically handles ETags and Cache-Control headers.
-        self.client: CacheClient | None = CacheClient(headers=headers)
+        # GitHub marks authenticated responses "private, max-age=60", which a
+        # shared cache must not store. As a private cache, stale entries from a
+        # previous run are revalidated with If-None-Match; an unchanged file then
+        # comes back as a body-less 304 that does not count against rate limits.
+        HTTP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # Every request goes to the same host, so HTTP/2 lets concurrent fetches
+        # share a few multiplexed, kept-alive connections.
+        self.client: CacheClient | None = CacheClient(
+            headers=headers,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=20, max_keepalive_connections=20, keepalive_expiry=60
+            ),
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            storage=hishel.AsyncSqliteStorage(database_path=HTTP_CACHE_PATH),
+            policy=hishel.SpecificationPolicy(
+                cache_options=hishel.CacheOptions(
+                    shared=False, supported_methods=["GET"]
+                )
+            ),
+        )
 
-    def __enter__(self) -> GitHubClient:
+    async def __aenter__(self) -> GitHubClient:
         return self
 
-    def __exit__(
+    async def __aexit__(
         self,
         exc_type: Optional[type[BaseException]],
         exc_val: Optional[BaseException],
         exc_tb: Optional[Any],
     ) -> None:
-        self.close()
+        await self.close()
 
-    def _get_paginated(self, url: str) -> List[dict[str, Any]]:
-        """Handles pagination for a GitHub API GET request."""
+    async def _get_paginated(
+        self,
+        url: str,
+        stop: Optional[Callable[[List[dict[str, Any]]], bool]] = None,
+    ) -> List[dict[str, Any]]:
+        """
+        Handles pagination for a GitHub API GET request.
+        If given, `stop` is called with each page and ends pagination early once
+        it returns True.
+        """
         if not self.client:
             raise RuntimeError("Client is not initialized or has been closed.")
 
         items = []
         try:
-            response = self.client.get(url)
+            response = await self.client.get(url)
             response.raise_for_status()
-            items.extend(response.json())
+            page = _json(response)
+            items.extend(page)
 
-            while "next" in response.links:
+            while "next" in response.links and not (stop and stop(page)):
                 next_url = response.links["next"]["url"]
                 logger.info("Fetching next page: %s", next_url)
-                response = self.client.get(next_url)
+                response = await self.client.get(next_url)
                 response.raise_for_status()
-                items.extend(response.json())
+                page = _json(response)
+                items.extend(page)
 
         except httpx.HTTPStatusError as e:
             logger.error("HTTP error during paginated fetch for %s: %s", url, e)
@@ -70,11 +114,11 @@ class GitHubClient:
             raise Exception("No repos, nothing to do")
         return items
 
-    def get_public_repos(self) -> List[schemas.RepoInventoryItem]:
+    async def get_public_repos(self) -> List[schemas.RepoInventoryItem]:
         """Fetches all public repositories for the user."""
         logger.info("Fetching public repositories for %s...", self.username)
         url = f"{API_URL}/users/{self.username}/repos?type=public&per_page=100"
-        repo_data = self._get_paginated(url)
+        repo_data = await self._get_paginated(url)
 
         repos = []
         for item in repo_data:
@@ -89,7 +133,7 @@ class GitHubClient:
                     stars=item.get("stargazers_count", 0),
                     forks=item.get("forks_count", 0),
                     open_issues=item.get("open_issues_count", 0),
-                    pushed_utc=item["pushed_at"],
+                    pushed_utc=datetime.fromisoformat(item["pushed_at"]),
                     homepage=item.get("homepage"),
                     default_branch=item["default_branch"],
                 )
@@ -98,16 +142,24 @@ class GitHubClient:
         logger.info("Found %d public repositories.", len(repos))
         return sorted(repos, key=lambda r: r.pushed_utc, reverse=True)
 
-    def get_public_events(self) -> List[dict[str, Any]]:
-        """Fetches recent public events for the user."""
+    async def get_public_events(self, since_utc: datetime) -> List[dict[str, Any]]:
+        """
+        Fetches recent public events for the user, newest first.
+        Stops paginating once a page reaches events older than `since_utc`.
+        """
         if not self.client:
             raise RuntimeError("Client is not initialized or has been closed.")
 
+        def reached_since(page: List[dict[str, Any]]) -> bool:
+            return bool(page) and (
+                datetime.fromisoformat(page[-1]["created_at"]) < since_utc
+            )
+
         logger.info("Fetching public events for %s...", self.username)
         url = f"{API_URL}/users/{self.username}/events/public?per_page=100"
-        return self._get_paginated(url)
+        return await self._get_paginated(url, stop=reached_since)
 
-    def get_file_content(
+    async def get_file_content(
         self, repo_full_name: str, file_path: str, branch: str
     ) -> Optional[str]:
         """
@@ -123,7 +175,7 @@ class GitHubClient:
             headers = {"Accept": "application/vnd.github.raw"}
             # Explicitly pass the branch name as a query parameter
             params = {"ref": branch}
-            response = self.client.get(url, headers=headers, params=params)
+            response = await self.client.get(url, headers=headers, params=params)
 
             if response.status_code == 404:
                 logger.debug(
@@ -145,7 +197,72 @@ class GitHubClient:
             )
             return None
 
-    def get_recent_file_changes(self, repo_full_name: str) -> Optional[List[str]]:
+    async def graphql(
+        self, query: str, variables: Optional[dict[str, Any]] = None
+    ) -> dict[str, Any]:
+        """
+        Runs a query against the GitHub GraphQL API and returns its "data" payload.
+        Errors reported alongside partial data are logged, not raised.
+        """
+        if not self.client:
+            raise RuntimeError("Client is not initialized or has been closed.")
+
+        response = await self.client.post(
+            GRAPHQL_URL, json={"query": query, "variables": variables or {}}
+        )
+        response.raise_for_status()
+        payload = _json(response)
+        for error in payload.get("errors") or []:
+            logger.warning("GraphQL error: %s", error.get("message", error))
+        return payload.get("data") or {}
+
+    async def get_files_content(
+        self, files: Sequence[tuple[str, str, Sequence[str]]]
+    ) -> dict[str, dict[str, Optional[str]]]:
+        """
+        Fetches several files from several repositories in a single GraphQL request.
+
+        Args:
+            files: (repo_full_name, branch, file_paths) for each repository.
+
+        Returns:
+            A mapping of repo_full_name -> file_path -> content, where content is
+            None if the file was not found (or is binary).
+        """
+        # Every repo x path combination becomes an aliased field, so that the
+        # response can be mapped back without relying on ordering.
+        fields = []
+        for repo_index, (repo_full_name, branch, file_paths) in enumerate(files):
+            owner, name = repo_full_name.split("/", 1)
+            objects = "\n".join(
+                f"    f{path_index}: object(expression: "
+                f"{json.dumps(f'{branch}:{file_path}')}) {{ ... on Blob {{ text }} }}"
+                for path_index, file_path in enumerate(file_paths)
+            )
+            fields.append(
+                f"  r{repo_index}: repository(owner: {json.dumps(owner)}, "
+                f"name: {json.dumps(name)}) {{\n{objects}\n  }}"
+            )
+        query = "query {\n" + "\n".join(fields) + "\n}"
+
+        try:
+            data = await self.graphql(query)
+        except httpx.HTTPStatusError as e:
+            logger.warning("Could not fetch files via GraphQL: %s", e)
+            data = {}
+
+        results: dict[str, dict[str, Optional[str]]] = {}
+        for repo_index, (repo_full_name, _, file_paths) in enumerate(files):
+            repo_data = data.get(f"r{repo_index}") or {}
+            results[repo_full_name] = {
+                file_path: (repo_data.get(f"f{path_index}") or {}).get("text")
+                for path_index, file_path in enumerate(file_paths)
+            }
+        return results
+
+    async def get_recent_file_changes(
+        self, repo_full_name: str, default_branch: str
+    ) -> Optional[List[str]]:
         """
         Gets a list of all file paths from the latest commit's tree.
         This is for the detailed summary of "hot" repos.
@@ -153,22 +270,15 @@ class GitHubClient:
         if not self.client:
             raise RuntimeError("Client is not initialized or has been closed.")
 
-        commits_url = f"{API_URL}/repos/{repo_full_name}/commits"
+        # GitHub resolves a branch name to its latest commit's tree server-side,
+        # so there is no need to look up the commit SHA first.
+        tree_url = f"{API_URL}/repos/{repo_full_name}/git/trees/{default_branch}"
         try:
-            # Get the SHA of the latest commit on the default branch
-            response = self.client.get(commits_url, params={"per_page": 1})
-            response.raise_for_status()
-            latest_commit = response.json()[0]
-            commit_sha = latest_commit["sha"]
-
             # Get the full commit tree recursively
-            tree_url = (
-                f"{API_URL}/repos/{repo_full_name}/git/trees/{commit_sha}?recursive=1"
-            )
-            tree_response = self.client.get(tree_url)
+            tree_response = await self.client.get(tree_url, params={"recursive": 1})
             tree_response.raise_for_status()
 
-            tree_data = tree_response.json()
+            tree_data = _json(tree_response)
             if tree_data.get("truncated"):
                 logger.warning("Commit tree for %s was truncated.", repo_full_name)
 
@@ -179,15 +289,15 @@ class GitHubClient:
                 if item.get("type") == "blob"
             ]
 
-        except (httpx.HTTPStatusError, IndexError, KeyError) as e:
+        except (httpx.HTTPStatusError, KeyError) as e:
             logger.error(
                 "Could not fetch recent file changes for %s: %s", repo_full_name, e
             )
             return None
 
-    def close(self) -> None:
+    async def close(self) -> None:
         """Closes the underlying httpx client if it exists."""
         if self.client:
-            self.client.close()
+            await self.client.aclose()
             self.client = None
             logger.info("GitHub client closed.")
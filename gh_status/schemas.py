@@ -4,17 +4,17 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+import msgspec
 
 
 # --- Inventory Schemas ---
 
 
-class RepoInventoryItem(BaseModel):
+class RepoInventoryItem(msgspec.Struct, kw_only=True):
     # Core Fields
     full: str
     desc: Optional[str] = None
-    topics: List[str] = Field(default_factory=list)
+    topics: List[str] = msgspec.field(default_factory=list)
     lang: Optional[str] = None
     stars: int = 0
     forks: int = 0
@@ -24,44 +24,41 @@ class RepoInventoryItem(BaseModel):
     default_branch: str
 
     # Detailed Fields for "Hot" Repos
-    readme: Optional[str] = Field(
-        None, description="The full content of the README file."
-    )
-    changelog: Optional[str] = Field(
-        None, description="The full content of the changelog file."
-    )
-    recent_files: Optional[List[str]] = Field(
-        None, description="A list of files changed in recent commits."
-    )
-
-
-class Inventory(BaseModel):
+    # The full content of the README file.
+    readme: Optional[str] = None
+    # The full content of the changelog file.
+    changelog: Optional[str] = None
+    # A list of files changed in recent commits.
+    recent_files: Optional[List[str]] = None
+
+
+class Inventory(msgspec.Struct, kw_only=True):
     schema_version: str = "1"
     username: str
     generated_utc: datetime
-    repo: List[RepoInventoryItem] = Field(default_factory=list)
+    repo: List[RepoInventoryItem] = msgspec.field(default_factory=list)
 
 
 # --- TODOs Schemas ---
 
 
-class RepoTodosItem(BaseModel):
+class RepoTodosItem(msgspec.Struct, kw_only=True):
     full: str
     todos: Optional[List[str]] = None
     synopsis: Optional[List[str]] = None
 
 
-class Todos(BaseModel):
+class Todos(msgspec.Struct, kw_only=True):
     schema_version: str = "1"
     username: str
     generated_utc: datetime
-    repo: List[RepoTodosItem] = Field(default_factory=list)
+    repo: List[RepoTodosItem] = msgspec.field(default_factory=list)
 
 
 # --- Activity Schemas ---
 
 
-class ActivitySummary(BaseModel):
+class ActivitySummary(msgspec.Struct, kw_only=True):
     events: int = 0
     repos: int = 0
     pushes: int = 0
@@ -74,14 +71,14 @@ class ActivitySummary(BaseModel):
     deletes: int = 0
 
 
-class ActivityInsights(BaseModel):
+class ActivityInsights(msgspec.Struct, kw_only=True):
     streak_days: int
     busiest_local_day: Optional[str] = None
     top_repos: List[str]
     top_event_types: List[str]
 
 
-class ActivityEvent(BaseModel):
+class ActivityEvent(msgspec.Struct, kw_only=True):
     type: str
     repo_owner: str
     repo_name: str
@@ -92,7 +89,7 @@ class ActivityEvent(BaseModel):
     event_id: str
 
 
-class Activity(BaseModel):
+class Activity(msgspec.Struct, kw_only=True):
     schema_version: str = "1"
     username: str
     generated_utc: datetime
@@ -100,20 +97,20 @@ class Activity(BaseModel):
     window_days: int
     summary: ActivitySummary
     insights: ActivityInsights
-    event: List[ActivityEvent] = Field(default_factory=list)
+    event: List[ActivityEvent] = msgspec.field(default_factory=list)
 
 
 # --- Hints Schema (Optional) ---
-class HintsSuggest(BaseModel):
-    queries: List[str] = Field(default_factory=list)
+class HintsSuggest(msgspec.Struct, kw_only=True):
+    queries: List[str] = msgspec.field(default_factory=list)
 
 
-class HintsContext(BaseModel):
-    recent_keywords: List[str] = Field(default_factory=list)
-    focus_repos: List[str] = Field(default_factory=list)
+class HintsContext(msgspec.Struct, kw_only=True):
+    recent_keywords: List[str] = msgspec.field(default_factory=list)
+    focus_repos: List[str] = msgspec.field(default_factory=list)
 
 
-class Hints(BaseModel):
+class Hints(msgspec.Struct, kw_only=True):
     schema_version: str = "1"
     generated_utc: datetime
     suggest: HintsSuggest
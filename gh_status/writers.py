@@ -3,12 +3,13 @@ from __future__ import annotations
 
 import json
 import logging
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import tomlkit
+import msgspec
+import tomli_w
 from jinja2 import Environment, PackageLoader, select_autoescape
-from pydantic import BaseModel
 
 from . import schemas
 
@@ -16,10 +17,14 @@ logger = logging.getLogger(__name__)
 
 # Set up the Jinja2 environment to load templates from our package's 'resources' folder.
 # This works for both local development and installed packages.
+# The templates never change at runtime, so auto_reload's staleness check is skipped.
 jinja_env = Environment(
     loader=PackageLoader("gh_status", "resources"),
     autoescape=select_autoescape(["html", "xml"]),
+    auto_reload=False,
 )
+# Rendered once per feed, so resolve it once at import.
+_WRAPPER_TEMPLATE = jinja_env.get_template("wrapper.html.jinja2")
 
 
 def _describe_feed(title: str) -> tuple[str, str]:
@@ -50,29 +55,38 @@ def _describe_feed(title: str) -> tuple[str, str]:
     )
 
 
-def write_toml(path: Path, data: BaseModel) -> None:
+def _drop_none(value: Any) -> Any:
+    """Recursively removes None-valued keys, which TOML cannot represent."""
+    if isinstance(value, dict):
+        return {k: _drop_none(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [_drop_none(v) for v in value]
+    return value
+
+
+def write_toml(path: Path, data: msgspec.Struct) -> None:
     """
-    Serializes a Pydantic model to a TOML file using tomlkit.
+    Serializes a schema struct to a TOML file using tomli_w.
 
     Args:
         path: The destination file path (e.g., docs/inventory.toml).
-        data: The Pydantic model instance to write.
+        data: The schema struct instance to write.
     """
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        data_dict = data.model_dump(mode="json", exclude_none=True)
-        toml_content = tomlkit.dumps(data_dict)
-
-        path.write_text(toml_content, encoding="utf-8")
+        # Datetimes are kept as-is; tomli_w writes them as native TOML datetimes.
+        payload = _drop_none(msgspec.to_builtins(data, builtin_types=(datetime,)))
+        with path.open("wb") as f:
+            tomli_w.dump(payload, f)
         logger.info("Successfully wrote TOML file to %s", path)
     except Exception as e:
         logger.error("Failed to write TOML file to %s: %s", path, e)
 
 
-def write_json(path: Path, data: BaseModel | dict[str, Any]) -> None:
+def write_json(path: Path, data: msgspec.Struct | dict[str, Any]) -> None:
     """
-    Serializes a Pydantic model or plain dictionary to a JSON file.
+    Serializes a schema struct or plain dictionary to a JSON file.
 
     Args:
         path: The destination file path (e.g., docs/inventory.json).
@@ -81,8 +95,8 @@ def write_json(path: Path, data: BaseModel | dict[str, Any]) -> None:
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
         payload = (
-            data.model_dump(mode="json", exclude_none=True)
-            if isinstance(data, BaseModel)
+            _drop_none(msgspec.to_builtins(data))
+            if isinstance(data, msgspec.Struct)
             else data
         )
         path.write_text(
@@ -103,11 +117,10 @@ def write_html_wrapper(toml_path: Path) -> None:
     """
     html_path = toml_path.with_suffix(toml_path.suffix + ".html")
     try:
-        template = jinja_env.get_template("wrapper.html.jinja2")
         toml_content = toml_path.read_text(encoding="utf-8")
         heading, description = _describe_feed(toml_path.name)
 
-        html_content = template.render(
+        html_content = _WRAPPER_TEMPLATE.render(
             title=toml_path.name,
             heading=heading,
             description=description,
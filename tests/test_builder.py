@@ -0,0 +1,121 @@
+import os
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from gh_status import builder
+
+
+def test_parse_markdown_round_trips_through_disk_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(builder, "MARKDOWN_CACHE_DIR", tmp_path)
+    builder._parse_markdown.cache_clear()
+    content = "# Title\n\nIntro line\n- [ ] first\n* [x] second\n"
+
+    todos, synopsis = builder._parse_markdown(content)
+
+    assert todos == ("# Title", "Intro line", "first", "second")
+    assert synopsis == ("Intro line", "- [ ] first", "* [x] second")
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    builder._parse_markdown.cache_clear()
+    assert builder._parse_markdown(content) == (todos, synopsis)
+
+
+def test_prune_markdown_cache_drops_old_versions_and_stale_entries(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache_dir = tmp_path / "md-v9"
+    monkeypatch.setattr(builder, "MARKDOWN_CACHE_DIR", cache_dir)
+    for old_dir in (tmp_path / "md", tmp_path / "md-v1"):
+        old_dir.mkdir()
+        (old_dir / "entry.json").write_text("{}")
+    cache_dir.mkdir()
+    (cache_dir / "fresh.json").write_text("{}")
+    stale = cache_dir / "stale.json"
+    stale.write_text("{}")
+    long_ago = time.time() - 31 * 24 * 60 * 60
+    os.utime(stale, (long_ago, long_ago))
+    (tmp_path / "http_cache.db").write_text("")
+
+    builder.prune_markdown_cache(max_age_days=30)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "http_cache.db",
+        "md-v9",
+    ]
+    assert [path.name for path in cache_dir.iterdir()] == ["fresh.json"]
+
+
+def test_calculate_streak_counts_back_from_latest_active_day() -> None:
+    days = {date(2026, 1, 1), date(2026, 1, 3), date(2026, 1, 4), date(2026, 1, 5)}
+
+    assert builder._calculate_streak(days) == 3
+    assert builder._calculate_streak({date(2026, 1, 1)}) == 1
+    assert builder._calculate_streak(set()) == 0
+
+
+def test_parse_todos_strips_markers_without_joining_lines() -> None:
+    content = "- [ ] first\n-\n[x] kept as is\n  * [X]  third  \r\n\nplain\n"
+
+    assert builder._parse_todos_from_content(content) == [
+        "first",
+        "[x] kept as is",
+        "third",
+        "plain",
+    ]
+    assert builder._parse_todos_from_content("- a\r- b") == ["a", "b"]
+    assert builder._parse_todos_from_content("- a\x0c* b\x85- c\u2028- [ ] d") == [
+        "a",
+        "b",
+        "c",
+        "d",
+    ]
+
+
+def _event(
+    event_id: str, event_type: str, repo: str, days_ago: int, **payload: Any
+) -> dict[str, Any]:
+    noon = datetime.now(timezone.utc).replace(
+        hour=12, minute=0, second=0, microsecond=0
+    )
+    created_at = noon - timedelta(days=days_ago)
+    return {
+        "id": event_id,
+        "type": event_type,
+        "repo": {"name": repo},
+        "created_at": created_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "payload": payload,
+    }
+
+
+def test_build_activity_summarizes_events_in_window() -> None:
+    commits = [{"sha": "abcdef1234567", "message": "Fix parser\n\nLonger body"}]
+    events = [
+        _event("1", "PushEvent", "me/app", 1, size=1, commits=commits, ref="main"),
+        _event("2", "ForkEvent", "me/app", 1),
+        _event("3", "ForkEvent", "me/lib", 1),
+        _event("4", "PushEvent", "me/app", 1, size=0, commits=[]),
+        _event("5", "IssuesEvent", "me/lib", 2),
+        _event("6", "WatchEvent", "other/tool", 4),
+        _event("7", "PushEvent", "me/old", 10, size=1, commits=commits),
+    ]
+
+    activity = builder.build_activity(events, "me", "UTC", window_days=7)
+
+    assert [event.event_id for event in activity.event] == ["1", "2", "3", "5", "6"]
+    assert activity.summary.events == 5
+    assert activity.summary.repos == 3
+    assert activity.summary.pushes == 1
+    assert activity.summary.issues == 1
+    assert activity.summary.stars == 1
+    assert activity.insights.top_event_types[0] == "ForkEvent:2"
+    busiest = datetime.now(timezone.utc).date() - timedelta(days=1)
+    assert activity.insights.busiest_local_day == busiest.isoformat()
+    assert activity.insights.streak_days == 2
+    assert activity.event[0].commits == ["abcdef1: Fix parser"]
+    assert activity.event[0].url == "https://github.com/me/app/tree/main"
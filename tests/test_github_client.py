@@ -1,3 +1,9 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+
+import httpx
+
 from gh_status.github_client import GitHubClient
 
 
@@ -5,3 +11,58 @@ def test_github_client_init() -> None:
     client = GitHubClient("test_user", "test_token")
     assert client.username == "test_user"
     assert client.client is not None
+
+
+def test_get_files_content_maps_aliases_back_to_files() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = json.loads(request.content)["query"]
+        assert 'repository(owner: "octo", name: "one")' in query
+        assert 'object(expression: "main:docs/TODO.md")' in query
+        return httpx.Response(
+            200,
+            json={
+                "data": {
+                    "r0": {"f0": {"text": "- a todo"}, "f1": None},
+                    "r1": None,
+                }
+            },
+        )
+
+    client = GitHubClient("test_user", "test_token")
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))  # type: ignore[assignment]
+
+    result = asyncio.run(
+        client.get_files_content(
+            [
+                ("octo/one", "main", ["docs/TODO.md", "README.md"]),
+                ("octo/two", "trunk", ["docs/TODO.md"]),
+            ]
+        )
+    )
+
+    assert result == {
+        "octo/one": {"docs/TODO.md": "- a todo", "README.md": None},
+        "octo/two": {"docs/TODO.md": None},
+    }
+
+
+def test_get_public_events_stops_paginating_past_since() -> None:
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        return httpx.Response(
+            200,
+            json=[{"id": "1", "created_at": "2026-01-01T00:00:00Z"}],
+            headers={"link": '<https://api.github.com/next>; rel="next"'},
+        )
+
+    client = GitHubClient("test_user", "test_token")
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))  # type: ignore[assignment]
+
+    events = asyncio.run(
+        client.get_public_events(since_utc=datetime(2026, 1, 2, tzinfo=timezone.utc))
+    )
+
+    assert len(events) == 1
+    assert len(requested) == 1